@@ -19,6 +19,7 @@ from tespy.tools.data_containers import DataContainerSimple as dc_simple
 from tespy.tools.data_containers import FluidComposition as dc_flu
 from tespy.tools.data_containers import FluidProperties as dc_prop
 from tespy.tools.fluid_properties import calc_physical_exergy
+from tespy.tools.fluid_properties import calc_physical_exergy_from_dead_state
 from tespy.tools.helpers import TESPyConnectionError
 
 # pass the warning messages to the logger
@@ -269,6 +270,8 @@ class Connection:
         self.variables = self.attr()
         self.variables0 = [x + '0' for x in self.variables.keys()]
         self.__dict__.update(self.variables)
+        # reusable buffer for the to_flow method
+        self.flow = [0, 0, 0, self.fluid.val]
         self.set_attr(**kwargs)
 
         msg = (
@@ -573,7 +576,14 @@ class Connection:
         out : list
             List of mass flow and fluid property information.
         """
-        return [self.m.val_SI, self.p.val_SI, self.h.val_SI, self.fluid.val]
+        # the buffer is reused to avoid one list allocation per call on the
+        # solver's hot path, the values are refreshed on every call
+        flow = self.flow
+        flow[0] = self.m.val_SI
+        flow[1] = self.p.val_SI
+        flow[2] = self.h.val_SI
+        flow[3] = self.fluid.val
+        return flow
 
     def to_flow_design(self):
         r"""
@@ -616,6 +626,34 @@ class Connection:
         self.ex_physical = self.ex_therm + self.ex_mech
         self.Ex_physical = self.m.val_SI * self.ex_physical
 
+    def get_physical_exergy_from_dead_state(self, h0, s0, T0):
+        r"""
+        Get a connection's specific physical exergy from a known dead state.
+
+        Same as :py:meth:`get_physical_exergy`, but with the dead state
+        enthalpy and entropy precomputed by the caller, as they are
+        identical for all connections sharing a fluid composition.
+
+        Parameters
+        ----------
+        h0 : float
+            Dead state enthalpy h0 / (J/kg).
+
+        s0 : float
+            Dead state entropy s0 / (J/(kgK)).
+
+        T0 : float
+            Ambient temperature T0 / K.
+        """
+        self.ex_therm, self.ex_mech = calc_physical_exergy_from_dead_state(
+            self, h0, s0, T0)
+        m = self.m.val_SI
+        self.Ex_therm = self.ex_therm * m
+        self.Ex_mech = self.ex_mech * m
+
+        self.ex_physical = self.ex_therm + self.ex_mech
+        self.Ex_physical = m * self.ex_physical
+
 
 class Ref:
     r"""
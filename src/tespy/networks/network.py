@@ -14,16 +14,26 @@ available from its original location tespy/networks/networks.py
 SPDX-License-Identifier: MIT
 """
 import ast
+import io
 import json
 import logging
 import os
 from collections import Counter
 from collections import OrderedDict
+from inspect import signature
+from math import sqrt
 from time import time
 
 import numpy as np
 import pandas as pd
 from numpy.linalg import norm
+from scipy.sparse import csc_matrix
+from scipy.sparse import diags
+from scipy.sparse.linalg import LinearOperator
+from scipy.sparse.linalg import gmres
+from scipy.sparse.linalg import lsmr
+from scipy.sparse.linalg import spilu
+from scipy.sparse.linalg import splu
 from tabulate import tabulate
 
 from tespy import connections as con
@@ -40,9 +50,35 @@ from tespy.tools.global_vars import err
 # Only require cupy if Cuda shall be used
 try:
     import cupy as cu
+    from cupyx.scipy.sparse import csr_matrix as cu_csr_matrix
+    from cupyx.scipy.sparse.linalg import spsolve as cu_spsolve
 except ModuleNotFoundError:
     cu = None
 
+# tolerance for the convergence and balance checks
+err_tol = err ** 0.5
+
+# scipy >= 1.12 renamed the gmres tolerance argument from tol to rtol
+gmres_tol_kwarg = 'rtol' if 'rtol' in signature(gmres).parameters else 'tol'
+
+# contribution of a component on a bus to the network exergy aggregation,
+# keyed by bus role and base: target attribute, sign and which of the
+# component's exergy flows (fuel or product) applies
+bus_exergy_contribution = {
+    ('E_F', 'bus'): ('E_F', 1, 'F'),
+    ('E_F', 'component'): ('E_F', -1, 'P'),
+    ('E_P', 'bus'): ('E_P', -1, 'F'),
+    ('E_P', 'component'): ('E_P', 1, 'P'),
+    ('E_L', 'bus'): ('E_L', -1, 'F'),
+    ('E_L', 'component'): ('E_L', 1, 'P'),
+    ('internal', 'bus'): (None, 0, None),
+    ('internal', 'component'): (None, 0, None),
+}
+
+# plain data types exported as they are by get_obj_props, resolved once
+# at import time instead of per cell
+obj_prop_types = (int, str, float, list, np.ndarray, con.Connection)
+
 
 class Network:
     r"""
@@ -181,6 +217,15 @@ class Network:
         # in case of a design calculation after an offdesign calculation
         self.redesign = False
 
+        # solver buffers, allocated on the first call of solve_loop
+        self.jacobian = None
+        self.residual = None
+        self.increment = None
+
+        # dead state properties per ambient state and fluid composition,
+        # shared between exergy analyses
+        self.dead_state_cache = {}
+
         self.checked = False
         self.design_path = None
         self.iterinfo = True
@@ -901,7 +946,7 @@ class Network:
             self.busses[b.label] = b
             self.num_bus_eq += b.P.is_set * 1
             for cp in b.comps.index:
-                b.comps.loc[cp, 'P_ref'] = np.nan
+                b.comps.at[cp, 'P_ref'] = np.nan
 
         series = pd.Series(dtype=np.float64)
         for cp in self.comps.index:
@@ -1243,33 +1288,41 @@ class Network:
         """
         if self.init_path is not None:
             df = self.init_read_connections(self.init_path)
+            # single hash join of network topology and init file data
+            # instead of a boolean mask lookup per connection
+            keys = ['source', 'source_id', 'target', 'target_id']
+            conns_df = pd.DataFrame({
+                'source': [c.source.label for c in self.conns.index],
+                'source_id': [c.source_id for c in self.conns.index],
+                'target': [c.target.label for c in self.conns.index],
+                'target_id': [c.target_id for c in self.conns.index]})
+            merged = conns_df.merge(
+                df.drop_duplicates(keys), on=keys, how='left',
+                indicator=True)
+            init_data = dict(
+                zip(self.conns.index, merged.to_dict('records')))
         # improved starting values for referenced connections,
         # specified vapour content values, temperature values as well as
         # subccooling/overheating and state specification
         for c in self.conns.index:
             if self.init_path is not None:
-                conn = df.loc[
-                    df['source'].isin([c.source.label]) &
-                    df['target'].isin([c.target.label]) &
-                    df['source_id'].isin([c.source_id]) &
-                    df['target_id'].isin([c.target_id])]
-                try:
-                    conn_id = conn.index[0]
+                row = init_data[c]
+                if row['_merge'] == 'both':
                     # overwrite SI-values with values from init_file,
                     # except user specified values
                     for prop in ['m', 'p', 'h']:
                         data = c.get_attr(prop)
-                        data.val0 = df.loc[conn_id, prop]
-                        data.unit = df.loc[conn_id, prop + '_unit']
+                        data.val0 = row[prop]
+                        data.unit = row[prop + '_unit']
 
                     for fluid in self.fluids:
                         if not c.fluid.val_set[fluid]:
-                            c.fluid.val[fluid] = df.loc[conn_id, fluid]
+                            c.fluid.val[fluid] = row[fluid]
                         c.fluid.val0[fluid] = c.fluid.val[fluid]
 
                     c.good_starting_values = True
 
-                except IndexError:
+                else:
                     msg = (
                         'Could not find connection ' + c.label + ' in '
                         'connections.csv of init_path ' + self.init_path + '.')
@@ -1413,7 +1466,8 @@ class Network:
 
     def solve(self, mode, init_path=None, design_path=None,
               max_iter=50, min_iter=4, init_only=False, init_previous=True,
-              use_cuda=False, always_all_equations=True):
+              use_cuda=False, always_all_equations=True,
+              linear_solver='direct'):
         r"""
         Solve the network.
 
@@ -1459,6 +1513,21 @@ class Network:
             will increase calculation speed, especially for mixtures, default:
             :code:`True`.
 
+        linear_solver : str
+            Solver for the linear systems of the newton algorithm: 'direct',
+            'lsmr', 'gmres' or 'mixed', default: :code:`'direct'`. The
+            iterative
+            'lsmr' solver is warm started from the increment of the previous
+            iteration and degrades gracefully near singular points, but
+            therefore does not detect linear dependencies in the
+            parametrisation. The 'gmres' solver uses an incomplete LU
+            preconditioner reused across several iterations and falls back
+            to the direct solve, if it does not converge. It is intended
+            for large flowsheets, where the direct factorisation dominates
+            the runtime. The 'mixed' solver factorises in single precision
+            and recovers double precision accuracy through iterative
+            refinement, halving the memory traffic of the factorisation.
+
         Note
         ----
         For more information on the solution process have a look at the online
@@ -1487,6 +1556,14 @@ class Network:
         self.iter = 0
         self.use_cuda = use_cuda
         self.always_all_equations = always_all_equations
+        self.linear_solver = linear_solver
+        self.ilu = None
+
+        if linear_solver not in ['direct', 'lsmr', 'gmres', 'mixed']:
+            msg = ('Linear solver must be "direct", "lsmr", "gmres" or '
+                   '"mixed".')
+            logging.error(msg)
+            raise ValueError(msg)
 
         if self.use_cuda and cu is None:
             msg = ('Specifying use_cuda=True requires cupy to be installed on '
@@ -1564,9 +1641,19 @@ class Network:
         r"""Loop of the newton algorithm."""
         # parameter definitions
         self.res = np.array([])
-        self.residual = np.zeros([self.num_vars])
-        self.increment = np.ones([self.num_vars])
-        self.jacobian = np.zeros((self.num_vars, self.num_vars))
+        # the solver buffers live on the host, the cuda path transfers
+        # them explicitly in matrix_inversion. Buffers of a previous call
+        # are reused if the problem size matches, e.g. for an offdesign
+        # calculation following the design calculation.
+        if (self.jacobian is None or
+                self.jacobian.shape != (self.num_vars, self.num_vars)):
+            self.residual = np.zeros([self.num_vars])
+            self.increment = np.ones([self.num_vars])
+            self.jacobian = np.zeros((self.num_vars, self.num_vars))
+        else:
+            self.residual.fill(0)
+            self.increment.fill(1)
+            self.jacobian.fill(0)
 
         self.start_time = time()
         self.progress = True
@@ -1578,15 +1665,27 @@ class Network:
 
             self.increment_filter = np.absolute(self.increment) < err ** 2
             self.solve_control()
-            self.res = np.append(self.res, norm(self.residual))
+            # direct BLAS dot product and scalar square root bypass the
+            # generic type dispatch of norm for contiguous float64 data
+            self.res = np.append(
+                self.res, sqrt(self.residual.dot(self.residual)))
 
             if self.iterinfo:
                 self.print_iterinfo_body()
 
-            if ((self.iter >= self.min_iter and self.res[-1] < err ** 0.5) or
+            if ((self.iter >= self.min_iter and self.res[-1] < err_tol) or
                     self.lin_dep):
                 break
 
+            # a negligible newton step norm terminates the iteration as
+            # well: the following increments cannot improve the solution,
+            # the residual criterion alone would run needless iterations
+            # on badly scaled residuals
+            if (self.iter >= self.min_iter and
+                    sqrt(float(self.increment.dot(self.increment))) <
+                    err ** 2):
+                break
+
             if self.iter > 40:
                 if (all(self.res[(self.iter - 3):] >= self.res[-3] * 0.95) and
                         self.res[-1] >= self.res[-2] * 0.95):
@@ -1600,7 +1699,7 @@ class Network:
         if self.iter == self.max_iter - 1:
             msg = ('Reached maximum iteration count (' + str(self.max_iter) +
                    '), calculation stopped. Residual value is '
-                   '{:.2e}'.format(norm(self.residual)))
+                   '{:.2e}'.format(sqrt(self.residual.dot(self.residual))))
             logging.warning(msg)
 
     def solve_determination(self):
@@ -1643,6 +1742,61 @@ class Network:
             logging.error(msg)
             raise hlp.TESPyNetworkError(msg)
 
+        # the structure of the jacobian is fixed across the iterations of the
+        # newton algorithm, precompute the variable indices and the column
+        # slices of every component's derivative block once
+        for c in self.conns.index:
+            c.conn_col = c.conn_loc * self.num_conn_vars
+
+        for cp in self.comps.index:
+            cp.conn_var_indices = np.array([
+                np.arange(loc * self.num_conn_vars,
+                          (loc + 1) * self.num_conn_vars)
+                for loc in cp.conn_loc])
+            cp.jacobian_cols = [
+                slice(loc * self.num_conn_vars,
+                      (loc + 1) * self.num_conn_vars)
+                for loc in cp.conn_loc]
+            # reusable destination for the fancy indexed increment filter
+            # rows, the fancy indexing would otherwise allocate a fresh
+            # array per component on every iteration
+            cp.increment_filter_buf = np.empty(
+                cp.conn_var_indices.shape, dtype=bool)
+
+        # the set of active connection specifications is fixed across a
+        # solve as well, resolve the val_set/ref_set dispatch once here
+        # instead of re-evaluating every branch on every iteration
+        conns = self.conns.index
+        self.conns_ref_set = {
+            var: [c for c in conns if c.get_attr(var).ref_set]
+            for var in ['m', 'p', 'h']}
+        self.conns_T_set = [c for c in conns if c.T.val_set]
+        self.conns_T_ref = [c for c in conns if c.T.ref_set]
+        self.conns_x_set = [c for c in conns if c.x.val_set]
+        self.conns_v_set = [c for c in conns if c.v.val_set]
+        self.conns_Td_bp_set = [c for c in conns if c.Td_bp.val_set]
+        self.conns_fluid_balance = [c for c in conns if c.fluid.balance]
+
+        # boolean masks of specified primary variables and fluid mass
+        # fractions, the specifications do not change during the newton
+        # iteration, so the per iteration dict and attribute lookups are
+        # replaced by these snapshots
+        self.var_set_masks = np.array(
+            [[c.m.val_set, c.p.val_set, c.h.val_set] for c in conns]).T
+        self.fluid_set_mask = np.array(
+            [[c.fluid.val_set[f] for f in self.fluids] for c in conns])
+
+        # temperature specifications of a single fluid network can be
+        # evaluated in one vectorised call, if the back end is available
+        # through the high level CoolProp interface (tabular back ends
+        # like BICUBIC or TTSE and TESPy fluids are not)
+        self.T_batch_fluid = None
+        if len(self.fluids) == 1:
+            fluid = self.fluids[0]
+            if self.fluids_backends[fluid] in ['HEOS', 'REFPROP', 'INCOMP']:
+                self.T_batch_fluid = (
+                    self.fluids_backends[fluid] + '::' + fluid)
+
     def print_iterinfo_head(self):
         """Print head of convergence progress."""
         if self.num_comp_vars == 0:
@@ -1661,30 +1815,34 @@ class Network:
 
     def print_iterinfo_body(self):
         """Print convergence progress."""
-        vec = self.increment[0:-(self.num_comp_vars + 1)]
+        # one row per connection, the norms of all variable types are
+        # calculated in a single vectorized pass
+        mat = self.increment[
+            :len(self.conns) * self.num_conn_vars].reshape(
+                -1, self.num_conn_vars)
         msg = (str(self.iter + 1))
 
-        if not self.lin_dep and not np.isnan(norm(self.residual)):
-            msg += '\t| ' + '{:.2e}'.format(norm(self.residual))
-            msg += ' | ' + '{:.2e}'.format(norm(vec[0::self.num_conn_vars]))
-            msg += ' | ' + '{:.2e}'.format(norm(vec[1::self.num_conn_vars]))
-            msg += ' | ' + '{:.2e}'.format(norm(vec[2::self.num_conn_vars]))
-
-            ls = []
-            for f in range(len(self.fluids)):
-                ls += vec[3 + f::self.num_conn_vars].tolist()
-
-            msg += ' | ' + '{:.2e}'.format(norm(ls))
+        # the residual norm of this iteration has been calculated in the
+        # solve loop already, reuse it instead of traversing the residual
+        # vector again
+        nr = self.res[-1]
+        if not self.lin_dep and np.isfinite(nr):
+            norms = np.sqrt((mat * mat).sum(axis=0))
+            msg += '\t| ' + '{:.2e}'.format(nr)
+            msg += ' | ' + '{:.2e}'.format(norms[0])
+            msg += ' | ' + '{:.2e}'.format(norms[1])
+            msg += ' | ' + '{:.2e}'.format(norms[2])
+            msg += ' | ' + '{:.2e}'.format(sqrt((norms[3:] ** 2).sum()))
 
             if self.num_comp_vars > 0:
                 msg += ' | ' + '{:.2e}'.format(norm(
                     self.increment[-self.num_comp_vars:]))
 
         else:
-            if np.isnan(norm(self.residual)):
+            if not np.isfinite(nr):
                 msg += '\t|      nan'
             else:
-                msg += '\t| ' + '{:.2e}'.format(norm(self.residual))
+                msg += '\t| ' + '{:.2e}'.format(nr)
             msg += ' |      nan' * 4
             if self.num_comp_vars > 0:
                 msg += ' |      nan'
@@ -1712,20 +1870,84 @@ class Network:
             print(msg)
 
     def matrix_inversion(self):
-        """Invert matrix of derivatives and caluclate increment."""
+        """Solve the linear system of derivatives and calculate increment."""
         self.lin_dep = True
         try:
-            # Let the matrix inversion be computed by the GPU if use_cuda in
+            # Let the linear system be solved by the GPU if use_cuda in
             # global_vars.py is true.
             if self.use_cuda:
-                self.increment = cu.asnumpy(cu.dot(
-                    cu.linalg.inv(cu.asarray(self.jacobian)),
-                    -cu.asarray(self.residual)))
+                # explicit host to device transfer per iteration, the
+                # sparse direct solve through cuSOLVER avoids the dense
+                # inversion, which is far slower than the sparsity of the
+                # system justifies; the increment is transferred back so
+                # all solver buffers stay on the host
+                self.increment = cu.asnumpy(cu_spsolve(
+                    cu_csr_matrix(cu.asarray(self.jacobian)),
+                    cu.asarray(-self.residual)))
+            elif self.linear_solver == 'lsmr':
+                # iterative least squares solve on the column scaled
+                # jacobian, warm started from the previous increment. The
+                # scaling equilibrates the different units of the variables
+                # (mass flow, pressure, enthalpy, mass fractions), which
+                # otherwise stall the iteration.
+                jacobian = csc_matrix(self.jacobian)
+                scale = np.sqrt(np.asarray(
+                    jacobian.multiply(jacobian).sum(axis=0))).ravel()
+                scale[scale == 0] = 1
+                self.increment = lsmr(
+                    jacobian.dot(diags(1 / scale)), -self.residual,
+                    atol=1e-12, btol=1e-12, conlim=0,
+                    maxiter=5 * self.num_vars,
+                    x0=self.increment * scale)[0] / scale
+            elif self.linear_solver == 'gmres':
+                # preconditioned iterative solve: the jacobian changes
+                # smoothly between newton iterations, the incomplete LU
+                # factorisation is therefore reused as preconditioner for
+                # several iterations before it is recomputed
+                jacobian = csc_matrix(self.jacobian)
+                if self.ilu is None or self.iter % 4 == 0:
+                    self.ilu = spilu(jacobian)
+                precon = LinearOperator(
+                    (self.num_vars, self.num_vars), self.ilu.solve)
+                self.increment, info = gmres(
+                    jacobian, -self.residual, x0=self.increment,
+                    M=precon, restart=30, **{gmres_tol_kwarg: err ** 2})
+                if info != 0:
+                    # fall back to the direct solve if gmres stalls
+                    self.increment = np.linalg.solve(
+                        self.jacobian, -self.residual)
+            elif self.linear_solver == 'mixed':
+                # single precision LU factorisation with double precision
+                # iterative refinement: the factorisation runs at half the
+                # memory traffic, the refinement recovers double precision
+                # accuracy for reasonably conditioned systems
+                lu = splu(csc_matrix(self.jacobian, dtype=np.float32))
+                rhs = -self.residual
+                x = lu.solve(rhs.astype(np.float32)).astype(np.float64)
+                for _ in range(3):
+                    x += lu.solve(
+                        (rhs - self.jacobian.dot(x)).astype(np.float32))
+                if not np.isfinite(x).all() or (
+                        np.abs(rhs - self.jacobian.dot(x)).max() >
+                        err * max(1, np.abs(rhs).max())):
+                    # refinement did not recover full accuracy, the system
+                    # is too ill conditioned for single precision
+                    x = np.linalg.solve(self.jacobian, rhs)
+                self.increment = x
+            elif self.num_vars > 500:
+                # every equation only touches the variables of the
+                # connections at its component, thus the jacobian is sparse:
+                # an LU factorisation of the sparse matrix needs far fewer
+                # FLOPs and less memory than the dense inverse for large
+                # networks
+                self.increment = splu(
+                    csc_matrix(self.jacobian)).solve(-self.residual)
             else:
-                self.increment = np.linalg.inv(
-                    self.jacobian).dot(-self.residual)
+                # solve directly instead of building the explicit inverse
+                self.increment = np.linalg.solve(
+                    self.jacobian, -self.residual)
             self.lin_dep = False
-        except np.linalg.linalg.LinAlgError:
+        except (np.linalg.LinAlgError, RuntimeError):
             self.increment = self.residual * 0
 
     def solve_control(self):
@@ -1747,30 +1969,34 @@ class Network:
         if self.lin_dep:
             return
 
-        # add the increment
+        # add the increment: one row per connection, branchless update
+        # steps, a specified variable receives a zero step and the pressure
+        # relaxation preventing negative pressures is calculated in bulk
+        inc = self.increment[
+            :len(self.conns) * self.num_conn_vars].reshape(
+                -1, self.num_conn_vars)
+        m_set, p_set, h_set = self.var_set_masks
+        p_vals = np.array([c.p.val_SI for c in self.conns.index])
+        dm = np.where(m_set, 0, inc[:, 0])
+        dp = np.where(p_set, 0, inc[:, 1] / np.maximum(
+            1, -inc[:, 1] / (0.5 * p_vals)))
+        dh = np.where(h_set, 0, inc[:, 2])
+        fluid_set = self.fluid_set_mask
+
         i = 0
         for c in self.conns.index:
             # mass flow, pressure and enthalpy
-            if not c.m.val_set:
-                c.m.val_SI += self.increment[i * (self.num_conn_vars)]
-            if not c.p.val_set:
-                # this prevents negative pressures
-                relax = max(1, -self.increment[i * (self.num_conn_vars) + 1] /
-                            (0.5 * c.p.val_SI))
-                c.p.val_SI += self.increment[
-                    i * (self.num_conn_vars) + 1] / relax
-            if not c.h.val_set:
-                c.h.val_SI += self.increment[i * (self.num_conn_vars) + 2]
+            c.m.val_SI += dm[i]
+            c.p.val_SI += dp[i]
+            c.h.val_SI += dh[i]
 
             # fluid vector (only if number of fluids is greater than 1)
             if len(self.fluids) > 1:
                 j = 0
                 for fluid in self.fluids:
                     # add increment
-                    if not c.fluid.val_set[fluid]:
-                        c.fluid.val[fluid] += (
-                                self.increment[
-                                    i * (self.num_conn_vars) + 3 + j])
+                    if not fluid_set[i, j]:
+                        c.fluid.val[fluid] += inc[i, 3 + j]
 
                     # keep mass fractions within [0, 1]
                     if c.fluid.val[fluid] < err:
@@ -1847,44 +2073,44 @@ class Network:
         fl = hlp.single_fluid(c.fluid.val)
 
         if fl is not None:
+            value_range = fp.Memorise.value_range[fl]
             # pressure
-            if c.p.val_SI < fp.Memorise.value_range[fl][0] and not c.p.val_set:
-                c.p.val_SI = fp.Memorise.value_range[fl][0]
+            if c.p.val_SI < value_range[0] and not c.p.val_set:
+                c.p.val_SI = value_range[0]
                 logging.debug(self.property_range_message(c, 'p'))
-            elif (c.p.val_SI > fp.Memorise.value_range[fl][1] and
-                  not c.p.val_set):
-                c.p.val_SI = fp.Memorise.value_range[fl][1]
+            elif c.p.val_SI > value_range[1] and not c.p.val_set:
+                c.p.val_SI = value_range[1]
                 logging.debug(self.property_range_message(c, 'p'))
 
-            # enthalpy
-            try:
-                hmin = fp.h_pT(
-                    c.p.val_SI, fp.Memorise.value_range[fl][2] * 1.001, fl)
-            except ValueError:
-                f = 1.05
-                hmin = fp.h_pT(
-                    c.p.val_SI, fp.Memorise.value_range[fl][2] * f, fl)
-
-            T = fp.Memorise.value_range[fl][3]
-            while True:
+            # enthalpy, the limiting values are only evaluated if the
+            # enthalpy is not specified by the user anyway
+            if not c.h.val_set:
                 try:
-                    hmax = fp.h_pT(c.p.val_SI, T, fl)
-                    break
-                except ValueError as e:
-                    T *= 0.99
-                    if T < fp.Memorise.value_range[fl][2]:
-                        raise ValueError(e)
-
-            if c.h.val_SI < hmin and not c.h.val_set:
-                if hmin < 0:
-                    c.h.val_SI = hmin * 0.9999
-                else:
-                    c.h.val_SI = hmin * 1.0001
-                logging.debug(self.property_range_message(c, 'h'))
+                    hmin = fp.h_pT(c.p.val_SI, value_range[2] * 1.001, fl)
+                except ValueError:
+                    f = 1.05
+                    hmin = fp.h_pT(c.p.val_SI, value_range[2] * f, fl)
+
+                T = value_range[3]
+                while True:
+                    try:
+                        hmax = fp.h_pT(c.p.val_SI, T, fl)
+                        break
+                    except ValueError as e:
+                        T *= 0.99
+                        if T < value_range[2]:
+                            raise ValueError(e)
+
+                if c.h.val_SI < hmin:
+                    if hmin < 0:
+                        c.h.val_SI = hmin * 0.9999
+                    else:
+                        c.h.val_SI = hmin * 1.0001
+                    logging.debug(self.property_range_message(c, 'h'))
 
-            elif c.h.val_SI > hmax and not c.h.val_set:
-                c.h.val_SI = hmax * 0.9999
-                logging.debug(self.property_range_message(c, 'h'))
+                elif c.h.val_SI > hmax:
+                    c.h.val_SI = hmax * 0.9999
+                    logging.debug(self.property_range_message(c, 'h'))
 
             if ((c.Td_bp.val_set or c.state.is_set) and
                     not c.h.val_set and self.iter < 3):
@@ -1971,37 +2197,34 @@ class Network:
         - Place residual values in residual value vector of the network.
         - Place partial derivatives in jacobian matrix of the network.
         """
-        # fetch component equation residuals and component partial derivatives
+        # fetch component equation residuals and component partial
+        # derivatives, the rows are contiguous per component
+        residual = self.residual
+        jacobian = self.jacobian
+        increment_filter = self.increment_filter
         sum_eq = 0
         sum_c_var = 0
         for cp in self.comps.index:
 
-            indices = []
-            for c in cp.conn_loc:
-                start = c * self.num_conn_vars
-                end = (c + 1) * self.num_conn_vars
-                indices += [np.arange(start, end)]
-
             cp.equations()
-            cp.derivatives(self.increment_filter[np.array(indices)])
+            cp.derivatives(increment_filter.take(
+                cp.conn_var_indices, out=cp.increment_filter_buf))
 
-            self.residual[sum_eq:sum_eq + cp.num_eq] = cp.residual
+            residual[sum_eq:sum_eq + cp.num_eq] = cp.residual
             deriv = cp.jacobian
 
             if deriv is not None:
                 i = 0
                 # place derivatives in jacobian matrix
-                for loc in cp.conn_loc:
-                    coll_s = loc * self.num_conn_vars
-                    coll_e = (loc + 1) * self.num_conn_vars
-                    self.jacobian[
-                        sum_eq:sum_eq + cp.num_eq, coll_s:coll_e] = deriv[:, i]
+                for cols in cp.jacobian_cols:
+                    jacobian[
+                        sum_eq:sum_eq + cp.num_eq, cols] = deriv[:, i]
                     i += 1
 
                 # derivatives for custom variables
                 for j in range(cp.num_vars):
                     coll = self.num_vars - self.num_comp_vars + sum_c_var
-                    self.jacobian[sum_eq:sum_eq + cp.num_eq, coll] = (
+                    jacobian[sum_eq:sum_eq + cp.num_eq, coll] = (
                         deriv[:, i + j, :1].transpose()[0])
                     sum_c_var += 1
 
@@ -2156,142 +2379,188 @@ class Network:
         """
         primary_vars = {'m': 0, 'p': 1, 'h': 2}
         k = self.num_comp_eq
-        for c in self.conns.index:
-            flow = c.to_flow()
-            col = c.conn_loc * self.num_conn_vars
-
-            # referenced mass flow, pressure or enthalpy
-            for var, pos in primary_vars.items():
-                if c.get_attr(var).ref_set:
-                    ref = c.get_attr(var).ref
-                    ref_col = ref.obj.conn_loc * self.num_conn_vars
-                    self.residual[k] = (
-                        c.get_attr(var).val_SI - (
-                            ref.obj.get_attr(var).val_SI * ref.f + ref.d))
-                    self.jacobian[k, col + pos] = 1
-                    self.jacobian[k, ref_col + pos] = -c.get_attr(var).ref.f
-                    k += 1
-
-            # temperature
-            if c.T.val_set:
-                self.residual[k] = c.T.val_SI - fp.T_mix_ph(
-                    flow, T0=c.T.val_SI)
-
-                self.jacobian[k, col + 1] = (
-                    -fp.dT_mix_dph(flow, T0=c.T.val_SI))
-                self.jacobian[k, col + 2] = (
-                    -fp.dT_mix_pdh(flow, T0=c.T.val_SI))
-                if len(self.fluids) != 1:
-                    col_s = c.conn_loc * self.num_conn_vars + 3
-                    col_e = (c.conn_loc + 1) * self.num_conn_vars
-                    if not all(self.increment_filter[col_s:col_e]):
-                        self.jacobian[k, col_s:col_e] = -fp.dT_mix_ph_dfluid(
-                            flow, T0=c.T.val_SI)
+        # local references avoid repeated attribute lookups in this
+        # interpreter bound loop
+        residual = self.residual
+        jacobian = self.jacobian
+        increment_filter = self.increment_filter
+        num_conn_vars = self.num_conn_vars
+        num_fluids = len(self.fluids)
+
+        # the loops below are specialised for the current solve: they only
+        # visit connections with the respective specification active, the
+        # lists have been built in solve_determination
+
+        # referenced mass flow, pressure or enthalpy
+        for var, pos in primary_vars.items():
+            for c in self.conns_ref_set[var]:
+                data = c.get_attr(var)
+                ref = data.ref
+                residual[k] = (
+                    data.val_SI - (
+                        ref.obj.get_attr(var).val_SI * ref.f + ref.d))
+                jacobian[k, c.conn_col + pos] = 1
+                jacobian[k, ref.obj.conn_col + pos] = -ref.f
                 k += 1
 
-            # referenced temperature
-            if c.T.ref_set:
-                ref = c.T.ref
-                flow_ref = ref.obj.to_flow()
-                ref_col = ref.obj.conn_loc * self.num_conn_vars
-                self.residual[k] = fp.T_mix_ph(flow, T0=c.T.val_SI) - (
-                    fp.T_mix_ph(flow_ref, T0=ref.obj.T.val_SI) *
-                    ref.f + ref.d)
-
-                self.jacobian[k, col + 1] = (
-                    fp.dT_mix_dph(flow, T0=c.T.val_SI))
-                self.jacobian[k, col + 2] = (
-                    fp.dT_mix_pdh(flow, T0=c.T.val_SI))
-
-                self.jacobian[k, ref_col + 1] = -(
-                    fp.dT_mix_dph(flow_ref, T0=ref.obj.T.val_SI) * ref.f)
-                self.jacobian[k, ref_col + 2] = -(
-                    fp.dT_mix_pdh(flow_ref, T0=ref.obj.T.val_SI) * ref.f)
-
-                # dT / dFluid
-                if len(self.fluids) != 1:
-                    col_s = c.conn_loc * self.num_conn_vars + 3
-                    col_e = (c.conn_loc + 1) * self.num_conn_vars
-                    ref_col_s = ref.obj.conn_loc * self.num_conn_vars + 3
-                    ref_col_e = (ref.obj.conn_loc + 1) * self.num_conn_vars
-                    if not all(self.increment_filter[col_s:col_e]):
-                        self.jacobian[k, col_s:col_e] = (
-                            fp.dT_mix_ph_dfluid(flow, T0=c.T.val_SI))
-                    if not all(self.increment_filter[ref_col_s:ref_col_e]):
-                        self.jacobian[k, ref_col_s:ref_col_e] = -(
-                            fp.dT_mix_ph_dfluid(flow_ref, T0=ref.obj.T.val_SI))
-                k += 1
+        # temperature
+        conns_T = self.conns_T_set
+        if self.T_batch_fluid is not None and len(conns_T) > 1:
+            # evaluate the temperatures and the finite difference stencil
+            # of their derivatives for all specified connections in one
+            # vectorised CoolProp call
+            n = len(conns_T)
+            d = 1
+            p_arr = np.array([c.p.val_SI for c in conns_T])
+            h_arr = np.array([c.h.val_SI for c in conns_T])
+            T_arr = fp.T_ph_batch(
+                np.concatenate([p_arr, p_arr + d, p_arr - d, p_arr, p_arr]),
+                np.concatenate([h_arr, h_arr, h_arr, h_arr + d, h_arr - d]),
+                self.T_batch_fluid)
+            if np.isfinite(T_arr).all():
+                dT_dp = (T_arr[n:2 * n] - T_arr[2 * n:3 * n]) / (2 * d)
+                dT_dh = (T_arr[3 * n:4 * n] - T_arr[4 * n:]) / (2 * d)
+                for i, c in enumerate(conns_T):
+                    col = c.conn_col
+                    residual[k] = c.T.val_SI - T_arr[i]
+                    jacobian[k, col + 1] = -dT_dp[i]
+                    jacobian[k, col + 2] = -dT_dh[i]
+                    k += 1
+                conns_T = []
+            # non finite values indicate states outside the fluid's range
+            # of validity, fall back to the scalar path and its error
+            # handling for this iteration
 
-            # saturated steam fraction
-            if c.x.val_set:
-                if (np.absolute(self.residual[k]) > err ** 2 or
-                        self.iter % 2 == 0 or self.always_all_equations):
-                    self.residual[k] = c.h.val_SI - (
-                        fp.h_mix_pQ(flow, c.x.val_SI))
-                if not self.increment_filter[col + 1]:
-                    self.jacobian[k, col + 1] = -(
-                        fp.dh_mix_dpQ(flow, c.x.val_SI))
-                self.jacobian[k, col + 2] = 1
-                k += 1
+        for c in conns_T:
+            flow = c.to_flow()
+            col = c.conn_col
+            residual[k] = c.T.val_SI - fp.T_mix_ph(
+                flow, T0=c.T.val_SI)
+
+            jacobian[k, col + 1] = (
+                -fp.dT_mix_dph(flow, T0=c.T.val_SI))
+            jacobian[k, col + 2] = (
+                -fp.dT_mix_pdh(flow, T0=c.T.val_SI))
+            if num_fluids != 1:
+                col_s = col + 3
+                col_e = col + num_conn_vars
+                if not all(increment_filter[col_s:col_e]):
+                    jacobian[k, col_s:col_e] = -fp.dT_mix_ph_dfluid(
+                        flow, T0=c.T.val_SI)
+            k += 1
 
-            # volumetric flow
-            if c.v.val_set:
-                if (np.absolute(self.residual[k]) > err ** 2 or
-                        self.iter % 2 == 0 or self.always_all_equations):
-                    self.residual[k] = (
-                        c.v.val_SI - fp.v_mix_ph(flow, T0=c.T.val_SI) *
-                        c.m.val_SI)
-                self.jacobian[k, col] = -fp.v_mix_ph(flow, T0=c.T.val_SI)
-                self.jacobian[k, col + 1] = -(
-                    fp.dv_mix_dph(flow, T0=c.T.val_SI) * c.m.val_SI)
-                self.jacobian[k, col + 2] = -(
-                    fp.dv_mix_pdh(flow, T0=c.T.val_SI) * c.m.val_SI)
-                k += 1
+        # referenced temperature
+        for c in self.conns_T_ref:
+            flow = c.to_flow()
+            col = c.conn_col
+            ref = c.T.ref
+            flow_ref = ref.obj.to_flow()
+            ref_col = ref.obj.conn_col
+            residual[k] = fp.T_mix_ph(flow, T0=c.T.val_SI) - (
+                fp.T_mix_ph(flow_ref, T0=ref.obj.T.val_SI) *
+                ref.f + ref.d)
+
+            jacobian[k, col + 1] = (
+                fp.dT_mix_dph(flow, T0=c.T.val_SI))
+            jacobian[k, col + 2] = (
+                fp.dT_mix_pdh(flow, T0=c.T.val_SI))
+
+            jacobian[k, ref_col + 1] = -(
+                fp.dT_mix_dph(flow_ref, T0=ref.obj.T.val_SI) * ref.f)
+            jacobian[k, ref_col + 2] = -(
+                fp.dT_mix_pdh(flow_ref, T0=ref.obj.T.val_SI) * ref.f)
+
+            # dT / dFluid
+            if num_fluids != 1:
+                col_s = col + 3
+                col_e = col + num_conn_vars
+                ref_col_s = ref_col + 3
+                ref_col_e = ref_col + num_conn_vars
+                if not all(increment_filter[col_s:col_e]):
+                    jacobian[k, col_s:col_e] = (
+                        fp.dT_mix_ph_dfluid(flow, T0=c.T.val_SI))
+                if not all(increment_filter[ref_col_s:ref_col_e]):
+                    jacobian[k, ref_col_s:ref_col_e] = -(
+                        fp.dT_mix_ph_dfluid(flow_ref, T0=ref.obj.T.val_SI))
+            k += 1
+
+        # saturated steam fraction
+        for c in self.conns_x_set:
+            flow = c.to_flow()
+            col = c.conn_col
+            if (np.absolute(residual[k]) > err ** 2 or
+                    self.iter % 2 == 0 or self.always_all_equations):
+                residual[k] = c.h.val_SI - (
+                    fp.h_mix_pQ(flow, c.x.val_SI))
+            if not increment_filter[col + 1]:
+                jacobian[k, col + 1] = -(
+                    fp.dh_mix_dpQ(flow, c.x.val_SI))
+            jacobian[k, col + 2] = 1
+            k += 1
 
-            # temperature difference to boiling point
-            if c.Td_bp.val_set:
-                if (np.absolute(self.residual[k]) > err ** 2 or
-                        self.iter % 2 == 0 or self.always_all_equations):
-                    self.residual[k] = (
-                        fp.T_mix_ph(flow, T0=c.T.val_SI) - c.Td_bp.val_SI -
-                        fp.T_bp_p(flow))
-                if not self.increment_filter[col + 1]:
-                    self.jacobian[k, col + 1] = (
-                        fp.dT_mix_dph(flow, T0=c.T.val_SI) - fp.dT_bp_dp(flow))
-                if not self.increment_filter[col + 2]:
-                    self.jacobian[k, col + 2] = fp.dT_mix_pdh(
-                        flow, T0=c.T.val_SI)
-                k += 1
+        # volumetric flow
+        for c in self.conns_v_set:
+            flow = c.to_flow()
+            col = c.conn_col
+            if (np.absolute(residual[k]) > err ** 2 or
+                    self.iter % 2 == 0 or self.always_all_equations):
+                residual[k] = (
+                    c.v.val_SI - fp.v_mix_ph(flow, T0=c.T.val_SI) *
+                    c.m.val_SI)
+            jacobian[k, col] = -fp.v_mix_ph(flow, T0=c.T.val_SI)
+            jacobian[k, col + 1] = -(
+                fp.dv_mix_dph(flow, T0=c.T.val_SI) * c.m.val_SI)
+            jacobian[k, col + 2] = -(
+                fp.dv_mix_pdh(flow, T0=c.T.val_SI) * c.m.val_SI)
+            k += 1
+
+        # temperature difference to boiling point
+        for c in self.conns_Td_bp_set:
+            flow = c.to_flow()
+            col = c.conn_col
+            if (np.absolute(residual[k]) > err ** 2 or
+                    self.iter % 2 == 0 or self.always_all_equations):
+                residual[k] = (
+                    fp.T_mix_ph(flow, T0=c.T.val_SI) - c.Td_bp.val_SI -
+                    fp.T_bp_p(flow))
+            if not increment_filter[col + 1]:
+                jacobian[k, col + 1] = (
+                    fp.dT_mix_dph(flow, T0=c.T.val_SI) - fp.dT_bp_dp(flow))
+            if not increment_filter[col + 2]:
+                jacobian[k, col + 2] = fp.dT_mix_pdh(
+                    flow, T0=c.T.val_SI)
+            k += 1
 
-            # fluid composition balance
-            if c.fluid.balance:
-                j = 0
-                res = 1
-                for f in self.fluids:
-                    res -= c.fluid.val[f]
-                    self.jacobian[k, c.conn_loc + 3 + j] = -1
-                    j += 1
+        # fluid composition balance
+        for c in self.conns_fluid_balance:
+            col = c.conn_col
+            j = 0
+            res = 1
+            for f in self.fluids:
+                res -= c.fluid.val[f]
+                jacobian[k, col + 3 + j] = -1
+                j += 1
 
-                self.residual[k] = res
-                k += 1
+            residual[k] = res
+            k += 1
 
         # equations and derivatives for specified primary variables are static
         if self.iter == 0:
             for c in self.conns.index:
-                col = c.conn_loc * self.num_conn_vars
+                col = c.conn_col
 
                 # specified mass flow, pressure and enthalpy
                 for var, pos in primary_vars.items():
                     if c.get_attr(var).val_set:
-                        self.residual[k] = 0
-                        self.jacobian[k, col + pos] = 1
+                        residual[k] = 0
+                        jacobian[k, col + pos] = 1
                         k += 1
 
                 j = 0
                 # specified fluid mass fraction
                 for f in self.fluids:
                     if c.fluid.val_set[f]:
-                        self.jacobian[k, col + 3 + j] = 1
+                        jacobian[k, col + 3 + j] = 1
                         k += 1
                     j += 1
 
@@ -2303,6 +2572,7 @@ class Network:
         - Place residual values in residual value vector of the network.
         - Place partial derivatives in jacobian matrix of the network.
         """
+        jacobian = self.jacobian
         row = self.num_comp_eq + self.num_conn_eq
         for bus in self.busses.values():
             if bus.P.is_set:
@@ -2313,12 +2583,10 @@ class Network:
                     deriv = -cp.bus_deriv(bus)
 
                     j = 0
-                    for loc in cp.conn_loc:
-                        # start collumn index
-                        coll_s = loc * self.num_conn_vars
-                        # end collumn index
-                        coll_e = (loc + 1) * self.num_conn_vars
-                        self.jacobian[row, coll_s:coll_e] = deriv[:, j]
+                    # the column slices are the same as for the component
+                    # equations
+                    for cols in cp.jacobian_cols:
+                        jacobian[row, cols] = deriv[:, j]
                         j += 1
 
                 self.residual[row] = bus.P.val + P_res
@@ -2377,11 +2645,12 @@ class Network:
                 b.P.val += val
                 # save as reference value
                 if self.mode == 'design':
-                    if b.comps.loc[cp, 'base'] == 'component':
-                        b.comps.loc[cp, 'P_ref'] = (
-                            val / abs(b.comps.loc[cp, 'char'].evaluate(1)))
+                    # .at is the scalar fast path for single cell access
+                    if b.comps.at[cp, 'base'] == 'component':
+                        b.comps.at[cp, 'P_ref'] = (
+                            val / abs(b.comps.at[cp, 'char'].evaluate(1)))
                     else:
-                        b.comps.loc[cp, 'P_ref'] = val
+                        b.comps.at[cp, 'P_ref'] = val
 
         msg = 'Postprocessing complete.'
         logging.info(msg)
@@ -2612,10 +2881,13 @@ class Network:
         pamb_SI = self.convert_to_SI('p', pamb, self.p_unit)
         Tamb_SI = self.convert_to_SI('T', Tamb, self.T_unit)
 
-        self.component_exergy_data = pd.DataFrame(
-            columns=['label', 'E_F', 'E_P', 'E_D', 'epsilon', 'y_Dk', 'y*_Dk'])
-
-        self.connection_exergy_data = pd.DataFrame(columns=['e_PH', 'E_PH'])
+        # the rows of the result DataFrames are collected in plain lists
+        # first, appending rows to a DataFrame reallocates index and data
+        # with every single row
+        comp_nums = []
+        comp_index = []
+        conn_rows = []
+        conn_index = []
 
         self.E_P = 0
         self.E_F = 0
@@ -2631,25 +2903,16 @@ class Network:
             logging.error(msg)
             raise hlp.TESPyNetworkError(msg)
 
-        # physical exergy of connections
-        for conn in self.conns.index:
-            conn.get_physical_exergy(pamb_SI, Tamb_SI)
-            self.connection_exergy_data.loc[conn.label] = [
-                conn.ex_physical, conn.Ex_physical]
-
-        # exergy balance of components
-
-        for cp in self.comps.index:
-            cp.exergy_balance(Tamb_SI)
-            self.E_D += cp.E_D
-
-            self.component_exergy_data.loc[cp.label] = [
-                cp.label, cp.E_F, cp.E_P, cp.E_D, cp.epsilon, np.nan, np.nan]
-
-            cp_on_num_busses = 0
-            for b in E_F + E_P + internal_busses + E_L:
-                if cp in b.comps.index:
-                    if cp_on_num_busses > 0:
+        # map every component to the bus it is part of: a single dict
+        # lookup per component instead of searching the index of every
+        # bus, the same pass detects components on more than one bus
+        comp_on_bus = {}
+        for role, busses in [
+                ('E_F', E_F), ('E_P', E_P),
+                ('internal', internal_busses), ('E_L', E_L)]:
+            for b in busses:
+                for cp in b.comps.index:
+                    if cp in comp_on_bus:
                         msg = (
                             'The component ' + cp.label + ' is on multiple '
                             'busses in the exergy analysis. Make sure that no '
@@ -2657,54 +2920,97 @@ class Network:
                             'busses passed to the exergy_analysis method.')
                         logging.error(msg)
                         raise hlp.TESPyNetworkError(msg)
+                    comp_on_bus[cp] = (b, role)
+
+        # physical exergy of connections: the dead state properties only
+        # depend on the ambient state and the fluid composition, so they
+        # are evaluated once per unique composition instead of once per
+        # connection and reused by repeated analyses at the same ambient
+        # state
+        dead_states = self.dead_state_cache
+        for conn in self.conns.index:
+            key = (pamb_SI, Tamb_SI, tuple(conn.fluid.val.items()))
+            if key not in dead_states:
+                dead_states[key] = (
+                    fp.h_mix_pT([0, pamb_SI, 0, conn.fluid.val], Tamb_SI),
+                    fp.s_mix_pT([0, pamb_SI, 0, conn.fluid.val], Tamb_SI))
+            conn.get_physical_exergy_from_dead_state(
+                *dead_states[key], Tamb_SI)
+            conn_rows += [[conn.ex_physical, conn.Ex_physical]]
+            conn_index += [conn.label]
+
+        self.connection_exergy_data = pd.DataFrame(
+            conn_rows, index=conn_index, columns=['e_PH', 'E_PH'])
 
-                    if b.comps.loc[cp, 'base'] == 'bus':
-                        cp_E_P = cp.E_bus
-                        cp_E_F = cp.E_bus / cp.calc_bus_efficiency(b)
-                    else:
-                        cp_E_P = cp.E_bus * cp.calc_bus_efficiency(b)
-                        cp_E_F = cp.E_bus
-
-                    cp_E_D = cp_E_F - cp_E_P
-                    self.E_D += cp_E_D
-                    epsilon = cp_E_P / cp_E_F
-
-                    if b in E_F:
-                        if b.comps.loc[cp, 'base'] == 'bus':
-                            self.E_F += cp_E_F
-                        else:
-                            self.E_F -= cp_E_P
-                    elif b in E_P:
-                        if b.comps.loc[cp, 'base'] == 'bus':
-                            self.E_P -= cp_E_F
-                        else:
-                            self.E_P += cp_E_P
-                    elif b in E_L:
-                        if b.comps.loc[cp, 'base'] == 'bus':
-                            self.E_L -= cp_E_F
-                        else:
-                            self.E_L += cp_E_P
-
-                    cp_on_num_busses += 1
-
-                    label = cp.label + ' on bus ' + b.label
-                    self.component_exergy_data.loc[label] = [
-                        label, cp_E_F, cp_E_P, cp_E_D, epsilon, np.nan, np.nan]
-
-        self.E_D = self.component_exergy_data['E_D'].sum()
+        # exergy balance of components
+
+        for cp in self.comps.index:
+            cp.exergy_balance(Tamb_SI)
+            self.E_D += cp.E_D
+
+            comp_nums += [(cp.E_F, cp.E_P, cp.E_D, cp.epsilon)]
+            comp_index += [cp.label]
+
+            entry = comp_on_bus.get(cp)
+            if entry is not None:
+                b, role = entry
+                # scalar at lookup and locals for the bus efficiency and
+                # energy transfer, the efficiency evaluates the bus
+                # characteristic
+                base = b.comps.at[cp, 'base']
+                eta = cp.calc_bus_efficiency(b)
+                E_bus = cp.E_bus
+
+                if base == 'bus':
+                    cp_E_P = E_bus
+                    cp_E_F = E_bus / eta
+                else:
+                    cp_E_P = E_bus * eta
+                    cp_E_F = E_bus
+
+                cp_E_D = cp_E_F - cp_E_P
+                self.E_D += cp_E_D
+                epsilon = cp_E_P / cp_E_F
+
+                # table driven dispatch instead of a six way branch
+                attr, sign, flow = bus_exergy_contribution[(role, base)]
+                if attr is not None:
+                    setattr(self, attr, getattr(self, attr) + sign * (
+                        cp_E_F if flow == 'F' else cp_E_P))
+
+                label = cp.label + ' on bus ' + b.label
+                comp_nums += [(cp_E_F, cp_E_P, cp_E_D, epsilon)]
+                comp_index += [label]
+
+        # typed float64 storage for the numeric columns, so aggregation
+        # and the destruction ratios run on contiguous arrays instead of
+        # object dtype columns
+        nums = np.array(comp_nums, dtype=np.float64)
+        self.component_exergy_data = pd.DataFrame(
+            nums, index=comp_index,
+            columns=['E_F', 'E_P', 'E_D', 'epsilon'])
+        self.component_exergy_data.insert(0, 'label', comp_index)
+
+        # aggregate on the raw exergy destruction array, components
+        # without an exergy balance carry nan
+        E_D_arr = nums[:, 2]
+        self.E_D = float(np.nansum(E_D_arr))
         self.E_F = abs(self.E_F)
         self.E_P = abs(self.E_P)
 
         self.epsilon = self.E_P / self.E_F
 
         # calculate exergy destruction ratios for components/busses
-        self.component_exergy_data['y_Dk'] = (
-            self.component_exergy_data['E_D'] / self.E_F)
-        self.component_exergy_data['y*_Dk'] = (
-            self.component_exergy_data['E_D'] / self.E_D)
+        self.component_exergy_data['y_Dk'] = E_D_arr / self.E_F
+        self.component_exergy_data['y*_Dk'] = E_D_arr / self.E_D
+
+        # sort once here, so repeated printouts do not re-sort and copy
+        # the table on every call
+        self._component_exergy_data_sorted = (
+            self.component_exergy_data.sort_values(by='E_D', ascending=False))
 
         residual = abs(self.E_F - self.E_P - self.E_L - self.E_D)
-        if residual >= err ** 0.5:
+        if residual >= err_tol:
             msg = (
                 'The exergy balance of your network is not closed (residual '
                 'value is ' + str(round(residual, 6)) + ', but should be '
@@ -2718,8 +3024,10 @@ class Network:
     def print_results(self, colored=True):
         r"""Print the calculations results to prompt."""
 
-        for cp in self.comps['comp_type'].unique():
-            df = self.comps[self.comps['comp_type'] == cp].copy()
+        # one linear pass over the components instead of re-masking the
+        # full DataFrame per component type
+        for cp, df in self.comps.groupby('comp_type', sort=False):
+            df = df.copy()
 
             # gather parameters to print for components of type c
             cols = []
@@ -2731,8 +3039,9 @@ class Network:
             # are there any parameters to print?
             if len(cols) > 0:
                 for col in cols:
-                    df[col] = df.apply(
-                        Network.print_components, axis=1, args=(col, colored))
+                    df[col] = [
+                        Network.print_components(c, col, colored)
+                        for c in df.index]
 
                 df.drop(['comp_type'], axis=1, inplace=True)
                 df.set_index('label', inplace=True)
@@ -2744,28 +3053,30 @@ class Network:
                     print(tabulate(
                         df, headers='keys', tablefmt='psql', floatfmt='.2e'))
 
-        # connection properties
-        df = pd.DataFrame(columns=[
-            'm / (' + self.m_unit + ')',
-            'p / (' + self.p_unit + ')',
-            'h / (' + self.h_unit + ')',
-            'T / (' + self.T_unit + ')'])
+        # connection properties, rows collected in lists and the DataFrame
+        # built in one pass
+        rows = []
+        idx = []
         for c in self.conns.index:
             if c.printout:
-                row = (c.source.label + ':' + c.source_id + ' -> ' +
-                       c.target.label + ':' + c.target_id)
+                idx += [c.source.label + ':' + c.source_id + ' -> ' +
+                        c.target.label + ':' + c.target_id]
 
                 row_data = []
                 for var in ['m', 'p', 'h', 'T']:
-                    if c.get_attr(var).val_set and colored:
+                    data = c.get_attr(var)
+                    if data.val_set and colored:
                         row_data += [
-                            coloring['set'] + str(c.get_attr(var).val) +
-                            coloring['end']
-                        ]
+                            coloring['set'] + str(data.val) + coloring['end']]
                     else:
-                        row_data += [str(c.get_attr(var).val)]
+                        row_data += [str(data.val)]
 
-                df.loc[row] = row_data
+                rows += [row_data]
+        df = pd.DataFrame(rows, index=idx, columns=[
+            'm / (' + self.m_unit + ')',
+            'p / (' + self.p_unit + ')',
+            'h / (' + self.h_unit + ')',
+            'T / (' + self.T_unit + ')'])
         if len(df) > 0:
             print('##### RESULTS (connections) #####')
             print(
@@ -2777,18 +3088,27 @@ class Network:
             if b.printout:
                 df['cp'] = b.comps.index
                 df['base'] = b.comps['base'].values
-                df['component'] = df['cp'].apply(lambda x: x.label)
-                df['bus value'] = df['cp'].apply(lambda x: x.calc_bus_value(b))
-                df['efficiency'] = df['cp'].apply(
-                    lambda x: x.calc_bus_efficiency(b))
+                # one pass over the components instead of one apply per
+                # column; plain lists keep the assignment valid for a bus
+                # without components
+                labels = []
+                bus_values = []
+                efficiencies = []
+                for cp in b.comps.index:
+                    labels += [cp.label]
+                    bus_values += [cp.calc_bus_value(b)]
+                    efficiencies += [cp.calc_bus_efficiency(b)]
+                df['component'] = labels
+                df['bus value'] = bus_values
+                df['efficiency'] = efficiencies
                 df.loc[df['base'] == 'component', 'comp value'] = (
                     df['bus value'] / df['efficiency'])
                 df.loc[df['base'] == 'bus', 'comp value'] = (
                     df['bus value'] * df['efficiency'])
                 df.drop(['cp', 'base'], axis=1, inplace=True)
                 df.loc['total'] = df.sum()
-                df.loc['total', 'efficiency'] = np.nan
-                df.loc['total', 'component'] = 'total'
+                df.at['total', 'efficiency'] = np.nan
+                df.at['total', 'component'] = 'total'
                 df.set_index('component', inplace=True)
                 print('##### RESULTS (' + b.label + ') #####')
                 print(tabulate(df, headers='keys', tablefmt='psql',
@@ -2796,32 +3116,34 @@ class Network:
 
     def print_components(c, *args):
         param, colored = args
-        if c.name.printout:
-            val = float(c.name.get_attr(param).val)
-            if not colored:
-                return str(val)
-            # else part
-            if (val < c.name.get_attr(param).min_val - err or
-                    val > c.name.get_attr(param).max_val + err):
-                return coloring['err'] + ' ' + str(val) + ' ' + coloring['end']
-            if c.name.get_attr(args[0]).is_var:
-                return coloring['var'] + ' ' + str(val) + ' ' + coloring['end']
-            if c.name.get_attr(args[0]).is_set:
-                return coloring['set'] + ' ' + str(val) + ' ' + coloring['end']
-            return str(val)
-        else:
+        if not c.printout:
             return np.nan
+        # single attribute lookup per cell
+        attr = c.get_attr(param)
+        val = float(attr.val)
+        if not colored:
+            return str(val)
+        # else part
+        if val < attr.min_val - err or val > attr.max_val + err:
+            return coloring['err'] + ' ' + str(val) + ' ' + coloring['end']
+        if attr.is_var:
+            return coloring['var'] + ' ' + str(val) + ' ' + coloring['end']
+        if attr.is_set:
+            return coloring['set'] + ' ' + str(val) + ' ' + coloring['end']
+        return str(val)
 
     def print_connection_exergy_data(self):
         r"""Print the calculations results of the (specific) physical exergy of
         the connections to prompt.
         """
-        df = pd.DataFrame(columns=['e_PH / (kJ / kg)', 'E_PH / MW'])
+        rows = []
+        idx = []
         for c in self.conns.index:
-            row = (c.source.label + ':' + c.source_id + ' -> ' +
-                   c.target.label + ':' + c.target_id)
-            row_data = [c.ex_physical/10**3, c.Ex_physical/10**6]
-            df.loc[row] = row_data
+            idx += [c.source.label + ':' + c.source_id + ' -> ' +
+                    c.target.label + ':' + c.target_id]
+            rows += [[c.ex_physical / 10 ** 3, c.Ex_physical / 10 ** 6]]
+        df = pd.DataFrame(
+            rows, index=idx, columns=['e_PH / (kJ / kg)', 'E_PH / MW'])
 
         self.df_exergy_conns = df
 
@@ -2846,8 +3168,10 @@ class Network:
             Sort the component results descending by exergy destruction.
         """
         if sort_desc:
-            df = self.component_exergy_data.sort_values(
-                by=['E_D'], ascending=False)
+            # sorted copy cached by exergy_analysis
+            df = self._component_exergy_data_sorted
+        else:
+            df = self.component_exergy_data
 
         print('\n##### RESULTS (components) Exergy analysis #####')
         print(tabulate(
@@ -2948,68 +3272,63 @@ class Network:
         fn : str
             Path/filename for the file.
         """
-        f = Network.get_props
+        # plain list comprehensions over the connection objects, the
+        # row-wise apply wraps every row into a Series per call
+        f = Network.get_obj_props
+        conns = list(self.conns.index)
         df = pd.DataFrame()
         # connection id
-        df['id'] = self.conns.apply(Network.get_id, axis=1)
+        df['id'] = [Network.get_obj_id(c) for c in conns]
 
         # general connection parameters
         # source
-        df['source'] = self.conns.apply(f, axis=1, args=('source', 'label'))
-        df['source_id'] = self.conns['source_id']
+        df['source'] = [c.source.label for c in conns]
+        df['source_id'] = self.conns['source_id'].values
         # target
-        df['target'] = self.conns.apply(f, axis=1, args=('target', 'label'))
-        df['target_id'] = self.conns['target_id']
+        df['target'] = [c.target.label for c in conns]
+        df['target_id'] = self.conns['target_id'].values
 
         # design and offdesign properties
         cols = ['design', 'offdesign', 'design_path', 'local_design',
                 'local_offdesign', 'label']
         for key in cols:
-            df[key] = self.conns.apply(f, axis=1, args=(key,))
+            df[key] = [f(c, key) for c in conns]
 
         # fluid properties
         cols = ['m', 'p', 'h', 'T', 'x', 'v', 'Td_bp']
         for key in cols:
             # values and units
-            df[key] = self.conns.apply(f, axis=1, args=(key, 'val'))
-            df[key + '_unit'] = self.conns.apply(f, axis=1, args=(key, 'unit'))
+            df[key] = [f(c, key, 'val') for c in conns]
+            df[key + '_unit'] = [f(c, key, 'unit') for c in conns]
 
             # connection parametrisation
-            df[key + '_unit_set'] = self.conns.apply(f, axis=1,
-                                                     args=(key, 'unit_set'))
-            df[key + '0'] = self.conns.apply(f, axis=1, args=(key, 'val0'))
-            df[key + '_set'] = self.conns.apply(f, axis=1,
-                                                args=(key, 'val_set'))
-            df[key + '_ref'] = self.conns.apply(f, axis=1,
-                                                args=(key, 'ref', 'obj',)
-                                                ).astype(str)
-            df[key + '_ref'] = df[key + '_ref'].str.extract(r' at (.*?)>',
-                                                            expand=False)
-            df[key + '_ref_f'] = self.conns.apply(f, axis=1,
-                                                  args=(key, 'ref', 'f',))
-            df[key + '_ref_d'] = self.conns.apply(f, axis=1,
-                                                  args=(key, 'ref', 'd',))
-            df[key + '_ref_set'] = self.conns.apply(f, axis=1,
-                                                    args=(key, 'ref_set',))
+            df[key + '_unit_set'] = [f(c, key, 'unit_set') for c in conns]
+            df[key + '0'] = [f(c, key, 'val0') for c in conns]
+            df[key + '_set'] = [f(c, key, 'val_set') for c in conns]
+            df[key + '_ref'] = [
+                Network.get_obj_id(ref) if isinstance(ref, con.Connection)
+                else np.nan for ref in (f(c, key, 'ref', 'obj')
+                                        for c in conns)]
+            df[key + '_ref_f'] = [f(c, key, 'ref', 'f') for c in conns]
+            df[key + '_ref_d'] = [f(c, key, 'ref', 'd') for c in conns]
+            df[key + '_ref_set'] = [f(c, key, 'ref_set') for c in conns]
 
         # state property
         key = 'state'
-        df[key] = self.conns.apply(f, axis=1, args=(key, 'val'))
-        df[key + '_set'] = self.conns.apply(f, axis=1, args=(key, 'is_set'))
+        df[key] = [f(c, key, 'val') for c in conns]
+        df[key + '_set'] = [f(c, key, 'is_set') for c in conns]
 
         # fluid composition
         for val in self.fluids:
             # fluid mass fraction
-            df[val] = self.conns.apply(f, axis=1, args=('fluid', 'val', val))
+            df[val] = [c.fluid.val[val] for c in conns]
 
             # fluid mass fraction parametrisation
-            df[val + '0'] = self.conns.apply(f, axis=1,
-                                             args=('fluid', 'val0', val))
-            df[val + '_set'] = self.conns.apply(f, axis=1,
-                                                args=('fluid', 'val_set', val))
+            df[val + '0'] = [c.fluid.val0[val] for c in conns]
+            df[val + '_set'] = [c.fluid.val_set[val] for c in conns]
 
         # fluid balance
-        df['balance'] = self.conns.apply(f, axis=1, args=('fluid', 'balance'))
+        df['balance'] = [c.fluid.balance for c in conns]
 
         df.to_csv(fn, sep=';', decimal='.', index=False, na_rep='nan')
         logging.debug('Connection information saved to ' + fn + '.')
@@ -3034,54 +3353,67 @@ class Network:
 
         df_comps = self.comps.copy()
 
-        # busses
-        df_comps['busses'] = df_comps.apply(
-            Network.get_busses, axis=1, args=(busses,))
-
+        # busses: map every component to its bus rows in one traversal of
+        # the busses instead of probing every bus index per component
+        comp_bus_rows = {}
+        for b in busses:
+            for cp in b.comps.index:
+                comp_bus_rows.setdefault(cp, []).append((b, b.comps.loc[cp]))
+
+        bus_data = {var: [] for var in ['busses', 'param', 'P_ref', 'char',
+                                        'base']}
+        for cp in df_comps.index:
+            rows = comp_bus_rows.get(cp, [])
+            bus_data['busses'] += [[b.label for b, _ in rows]]
+            bus_data['param'] += [[row['param'] for _, row in rows]]
+            bus_data['P_ref'] += [[row['P_ref'] for _, row in rows]]
+            bus_data['char'] += [[
+                Network.get_obj_id(row['char']) for _, row in rows]]
+            bus_data['base'] += [[row['base'] for _, row in rows]]
+
+        df_comps['busses'] = bus_data['busses']
         for var in ['param', 'P_ref', 'char', 'base']:
-            df_comps['bus_' + var] = df_comps.apply(
-                Network.get_bus_data, axis=1, args=(busses, var))
+            df_comps['bus_' + var] = bus_data[var]
 
         pd.options.mode.chained_assignment = None
-        f = Network.get_props
+        # plain list comprehensions over the component objects, the
+        # row-wise apply wraps every row into a Series per call
+        f = Network.get_obj_props
         for c in df_comps['comp_type'].unique():
             df = df_comps[df_comps['comp_type'] == c]
+            comps = list(df.index)
 
             # basic information
             cols = ['label', 'design', 'offdesign', 'design_path',
                     'local_design', 'local_offdesign']
             for col in cols:
-                df[col] = df.apply(f, axis=1, args=(col,))
+                df[col] = [f(cp, col) for cp in comps]
 
             # attributes
             for col, data in df.index[0].variables.items():
                 # component characteristics container
                 if isinstance(data, dc_cc) or isinstance(data, dc_cm):
-                    df[col] = df.apply(
-                        f, axis=1, args=(col, 'func')).astype(str)
-                    df[col] = df[col].str.extract(r' at (.*?)>', expand=False)
-                    df[col + '_set'] = df.apply(
-                        f, axis=1, args=(col, 'is_set'))
-                    df[col + '_param'] = df.apply(
-                        f, axis=1, args=(col, 'param'))
+                    df[col] = [
+                        Network.get_obj_id(func) if func is not None
+                        else np.nan for func in
+                        (f(cp, col, 'func') for cp in comps)]
+                    df[col + '_set'] = [f(cp, col, 'is_set') for cp in comps]
+                    df[col + '_param'] = [f(cp, col, 'param') for cp in comps]
 
                 # component property container
                 elif isinstance(data, dc_cp):
-                    df[col] = df.apply(f, axis=1, args=(col, 'val'))
-                    df[col + '_set'] = df.apply(
-                        f, axis=1, args=(col, 'is_set'))
-                    df[col + '_var'] = df.apply(
-                        f, axis=1, args=(col, 'is_var'))
+                    df[col] = [f(cp, col, 'val') for cp in comps]
+                    df[col + '_set'] = [f(cp, col, 'is_set') for cp in comps]
+                    df[col + '_var'] = [f(cp, col, 'is_var') for cp in comps]
 
                 # component property container
                 elif isinstance(data, dc_simple):
-                    df[col] = df.apply(f, axis=1, args=(col, 'val'))
-                    df[col + '_set'] = df.apply(
-                        f, axis=1, args=(col, 'is_set'))
+                    df[col] = [f(cp, col, 'val') for cp in comps]
+                    df[col + '_set'] = [f(cp, col, 'is_set') for cp in comps]
 
                 # component property container
                 elif isinstance(data, dc_gcp):
-                    df[col] = df.apply(f, axis=1, args=(col, 'method'))
+                    df[col] = [f(cp, col, 'method') for cp in comps]
 
             df.set_index('label', inplace=True)
             fn = path + c + '.csv'
@@ -3120,123 +3452,138 @@ class Network:
         fn : str
             Path/filename for the file.
         """
-        # components
-        df_comps = self.comps.copy()
-
-        # characteristic lines in components
+        # characteristic lines in components, one traversal without
+        # copying and re-masking the component DataFrame; deduplication
+        # through a set of object ids instead of scanning the list
         char_lines = []
         char_maps = []
-        for c in df_comps['comp_type'].unique():
-            df = df_comps[df_comps['comp_type'] == c]
-
+        seen = set()
+        for c, df in self.comps.groupby('comp_type', sort=False):
             for col, data in df.index[0].variables.items():
                 if isinstance(data, dc_cc):
-                    char_lines += [data.func]
+                    if id(data.func) not in seen:
+                        seen.add(id(data.func))
+                        char_lines.append(data.func)
                 elif isinstance(data, dc_cm):
-                    char_maps += [data.func]
+                    if id(data.func) not in seen:
+                        seen.add(id(data.func))
+                        char_maps.append(data.func)
 
         # characteristic lines in busses
         for bus in self.busses.values():
             for c in bus.comps.index:
-                ch = bus.comps.loc[c, 'char']
-                if ch not in char_lines:
-                    char_lines += [ch]
-
-        # characteristic line export
+                ch = bus.comps.at[c, 'char']
+                if id(ch) not in seen:
+                    seen.add(id(ch))
+                    char_lines.append(ch)
+
+        # characteristic export: the tables are tiny with a fixed schema,
+        # so the rows are built by plain comprehensions over the objects
+        # and written through a string buffer in a single call instead of
+        # the pandas csv writer; ast.literal_eval on the reading side
+        # round-trips the str() formatting of the data columns
         if len(char_lines) > 0:
-            # get id and data
-            df = pd.DataFrame({'id': char_lines}, index=char_lines)
-            df['id'] = df.apply(Network.get_id, axis=1)
-            df['type'] = df.apply(Network.get_class_base, axis=1)
-
             cols = ['x', 'y', 'extrapolate']
-            for val in cols:
-                df[val] = df.apply(Network.get_props, axis=1, args=(val,))
+            rows = [
+                [Network.get_obj_id(ch), type(ch).__name__] +
+                [Network.get_obj_props(ch, val) for val in cols]
+                for ch in char_lines]
 
             # write to char.csv
             fn = path + 'char_line.csv'
-            df.to_csv(fn, sep=';', decimal='.', index=False, na_rep='nan')
+            Network.write_csv(fn, ['id', 'type'] + cols, rows)
             logging.debug(
                 'Characteristic line information saved to ' + fn + '.')
 
         if len(char_maps) > 0:
-            # get id and data
-            df = pd.DataFrame({'id': char_maps}, index=char_maps)
-            df['id'] = df.apply(Network.get_id, axis=1)
-            df['type'] = df.apply(Network.get_class_base, axis=1)
-
             cols = ['x', 'y', 'z1', 'z2']
-            for val in cols:
-                df[val] = df.apply(Network.get_props, axis=1, args=(val,))
+            rows = [
+                [Network.get_obj_id(ch), type(ch).__name__] +
+                [Network.get_obj_props(ch, val) for val in cols]
+                for ch in char_maps]
 
             # write to char_map.csv
             fn = path + 'char_map.csv'
-            df.to_csv(fn, sep=';', decimal='.', index=False, na_rep='nan')
+            Network.write_csv(fn, ['id', 'type'] + cols, rows)
             logging.debug(
                 'Characteristic map information saved to ' + fn + '.')
 
+    @staticmethod
+    def write_csv(fn, header, rows):
+        """Write a small fixed schema table to a csv file in one call."""
+        buf = io.StringIO()
+        buf.write(';'.join(header) + '\n')
+        for row in rows:
+            buf.write(';'.join(
+                'nan' if val is None or val != val else str(val)
+                for val in row) + '\n')
+        with open(fn, 'w') as f:
+            f.write(buf.getvalue())
+
     @staticmethod
     def get_id(c):
         """Return the id of the python object."""
-        return str(c.name)[str(c.name).find(' at ') + 4:-1]
+        return Network.get_obj_id(c.name)
+
+    @staticmethod
+    def get_obj_id(obj):
+        """Return the id of the python object."""
+        # hex(id(obj)) is the address printed in the object's repr, without
+        # allocating the repr string and slicing it apart
+        return hex(id(obj))
 
     @staticmethod
     def get_class_base(c):
         """Return the class name."""
-        return c.name.__class__.__name__
+        return type(c.name).__name__
 
     @staticmethod
     def get_props(c, *args):
         """Return properties."""
-        if hasattr(c.name, args[0]):
-            if (not isinstance(c.name.get_attr(args[0]), int) and
-                    not isinstance(c.name.get_attr(args[0]), str) and
-                    not isinstance(c.name.get_attr(args[0]), float) and
-                    not isinstance(c.name.get_attr(args[0]), list) and
-                    not isinstance(c.name.get_attr(args[0]), np.ndarray) and
-                    not isinstance(c.name.get_attr(args[0]), con.Connection)):
+        return Network.get_obj_props(c.name, *args)
+
+    @staticmethod
+    def get_obj_props(obj, *args):
+        """Return properties of a network object."""
+        # single attribute lookup and a single isinstance check against
+        # a tuple of plain data types; missing attributes yield None like
+        # the previous hasattr guard did
+        val = getattr(obj, args[0], None)
+        if val is not None:
+            if not isinstance(val, obj_prop_types):
                 if len(args) == 1:
-                    return c.name.get_attr(args[0])
+                    return val
                 elif args[0] == 'fluid' and args[1] != 'balance':
-                    return c.name.fluid.get_attr(args[1])[args[2]]
+                    return obj.fluid.get_attr(args[1])[args[2]]
                 elif args[1] == 'ref':
-                    obj = c.name.get_attr(args[0]).get_attr(args[1])
-                    if obj is not None:
-                        return obj.get_attr(args[2])
+                    ref = val.get_attr(args[1])
+                    if ref is not None:
+                        return ref.get_attr(args[2])
                     else:
                         return np.nan
                 else:
-                    return c.name.get_attr(args[0]).get_attr(args[1])
-            elif isinstance(c.name.get_attr(args[0]), np.ndarray):
-                if len(c.name.get_attr(args[0]).shape) > 1:
-                    return tuple(c.name.get_attr(args[0]).tolist())
+                    return val.get_attr(args[1])
+            elif isinstance(val, np.ndarray):
+                if len(val.shape) > 1:
+                    return tuple(val.tolist())
                 else:
-                    return c.name.get_attr(args[0]).tolist()
+                    return val.tolist()
             else:
-                return c.name.get_attr(args[0])
+                return val
 
     @staticmethod
-    def get_busses(c, *args):
+    def get_busses(cp, busses):
         """Return the list of busses a component is integrated in."""
-        busses = []
-        for bus in args[0]:
-            if c.name in bus.comps.index:
-                busses += [bus.label]
-        return busses
+        return [bus.label for bus in busses if cp in bus.comps.index]
 
     @staticmethod
-    def get_bus_data(c, *args):
+    def get_bus_data(cp, busses, var):
         """Return bus information of a component."""
-        items = []
-        if args[1] == 'char':
-            for bus in args[0]:
-                if c.name in bus.comps.index:
-                    val = bus.comps.loc[c.name, args[1]]
-                    items += [str(val)[str(val).find(' at ') + 4:-1]]
-
+        if var == 'char':
+            return [
+                Network.get_obj_id(bus.comps.at[cp, var])
+                for bus in busses if cp in bus.comps.index]
         else:
-            for bus in args[0]:
-                if c.name in bus.comps.index:
-                    items += [bus.comps.loc[c.name, args[1]]]
-
-        return items
+            return [
+                bus.comps.at[cp, var]
+                for bus in busses if cp in bus.comps.index]
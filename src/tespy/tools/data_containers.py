@@ -93,13 +93,18 @@ class DataContainer:
     <class 'tespy.tools.data_containers.DataContainerSimple'>
     """
 
+    # slots instead of an instance dictionary: the data containers are
+    # accessed in the innermost solver loops, slotted attribute lookup is
+    # faster and reduces the memory footprint per instance
+    __slots__ = ()
+
     def __init__(self, **kwargs):
 
         var = self.attr()
 
         # default values
         for key in var.keys():
-            self.__dict__.update({key: var[key]})
+            setattr(self, key, var[key])
 
         self.set_attr(**kwargs)
 
@@ -117,7 +122,7 @@ class DataContainer:
         # specify values
         for key in kwargs:
             if key in var.keys():
-                self.__dict__.update({key: kwargs[key]})
+                setattr(self, key, kwargs[key])
 
             else:
                 msg = ('Data container of type ' + self.__class__.__name__ +
@@ -139,9 +144,9 @@ class DataContainer:
         out :
             Specified attribute.
         """
-        if key in self.__dict__:
-            return self.__dict__[key]
-        else:
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
             msg = ('Datacontainer of type ' + self.__class__.__name__ +
                    ' has no attribute \"' + str(key) + '\".')
             logging.error(msg)
@@ -180,6 +185,8 @@ class ComponentCharacteristics(DataContainer):
         default: method='default'.
     """
 
+    __slots__ = ('func', 'is_set', 'param')
+
     @staticmethod
     def attr():
         r"""
@@ -214,6 +221,8 @@ class ComponentCharacteristicMaps(DataContainer):
         default: method='default'.
     """
 
+    __slots__ = ('func', 'is_set', 'param')
+
     @staticmethod
     def attr():
         r"""
@@ -266,6 +275,10 @@ class ComponentProperties(DataContainer):
         Should the value of this attribute be printed in the results overview?
     """
 
+    # var_pos is assigned by the component initialisation for custom variables
+    __slots__ = ('val', 'val_SI', 'is_set', 'printout', 'd', 'min_val',
+                 'max_val', 'is_var', 'val_ref', 'design', 'var_pos')
+
     @staticmethod
     def attr():
         r"""
@@ -308,6 +321,8 @@ class FluidComposition(DataContainer):
         default: False.
     """
 
+    __slots__ = ('val', 'val0', 'val_set', 'design', 'balance')
+
     @staticmethod
     def attr():
         r"""
@@ -344,6 +359,8 @@ class GroupedComponentProperties(DataContainer):
         default elements=[].
     """
 
+    __slots__ = ('is_set', 'method', 'elements')
+
     @staticmethod
     def attr():
         r"""
@@ -396,6 +413,9 @@ class FluidProperties(DataContainer):
         default: unit_set=False.
     """
 
+    __slots__ = ('val', 'val0', 'val_SI', 'val_set', 'ref', 'ref_set',
+                 'unit', 'unit_set', 'design')
+
     @staticmethod
     def attr():
         r"""
@@ -425,6 +445,10 @@ class DataContainerSimple(DataContainer):
         Has the value for this property been set? default: val_set=False.
     """
 
+    # val_SI is assigned by components holding temperatures in this
+    # container, e.g. the ambient temperature of the simple heat exchanger
+    __slots__ = ('val', 'val_SI', 'is_set')
+
     @staticmethod
     def attr():
         r"""
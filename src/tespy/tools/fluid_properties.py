@@ -593,6 +593,34 @@ def T_ph(p, h, fluid):
         return Memorise.state[fluid].T()
 
 
+def T_ph_batch(p, h, fluid):
+    r"""
+    Calculate the temperature from pressure and enthalpy for a pure fluid.
+
+    Vectorised version of :py:func:`T_ph` evaluating all states in a single
+    CoolProp call. States outside the fluid's range of validity yield
+    :code:`inf` instead of raising an error. Not available for TESPy fluids,
+    the memorisation is bypassed.
+
+    Parameters
+    ----------
+    p : ndarray
+        Pressure values p / Pa.
+
+    h : ndarray
+        Specific enthalpy values h / (J/kg).
+
+    fluid : str
+        Fluid name including the CoolProp back end, e.g. :code:`HEOS::water`.
+
+    Returns
+    -------
+    T : ndarray
+        Temperature values T / K.
+    """
+    return CPPSI('T', 'P', p, 'H', h, fluid)
+
+
 def dT_mix_dph(flow, T0=300):
     r"""
     Calculate partial derivate of temperature to pressure.
@@ -1816,10 +1844,41 @@ def calc_physical_exergy(conn, p0, T0):
 
             e^\mathrm{PH} = e^\mathrm{T} + e^\mathrm{M}
     """
+    h0 = h_mix_pT([0, p0, 0, conn.fluid.val], T0)
+    s0 = s_mix_pT([0, p0, 0, conn.fluid.val], T0)
+    return calc_physical_exergy_from_dead_state(conn, h0, s0, T0)
+
+
+def calc_physical_exergy_from_dead_state(conn, h0, s0, T0):
+    r"""
+    Calculate specific physical exergy from a precomputed dead state.
+
+    The dead state properties only depend on the ambient state and the fluid
+    composition, so they can be shared between connections of identical
+    composition, see :py:func:`calc_physical_exergy` for the exergy formula.
+
+    Parameters
+    ----------
+    conn : tespy.connections.connection.Connection
+        Connection to calculate specific physical exergy for.
+
+    h0 : float
+        Dead state enthalpy :math:`h\left(p_0, T_0\right)` in J / kg.
+
+    s0 : float
+        Dead state entropy :math:`s\left(p_0, T_0\right)` in J / (kgK).
+
+    T0 : float
+        Ambient temperature T0 / K.
+
+    Returns
+    -------
+    e_ph : tuple
+        Specific thermal and mechanical exergy
+        (:math:`e^\mathrm{T}`, :math:`e^\mathrm{M}`) in J / kg.
+    """
     h_T0_p = h_mix_pT([0, conn.p.val_SI, 0, conn.fluid.val], T0)
     s_T0_p = s_mix_pT([0, conn.p.val_SI, 0, conn.fluid.val], T0)
     ex_therm = (conn.h.val_SI - h_T0_p) - T0 * (conn.s.val_SI - s_T0_p)
-    h0 = h_mix_pT([0, p0, 0, conn.fluid.val], T0)
-    s0 = s_mix_pT([0, p0, 0, conn.fluid.val], T0)
     ex_mech = (h_T0_p - h0) - T0 * (s_T0_p - s0)
     return ex_therm, ex_mech
@@ -588,6 +588,14 @@ class TestNetworkErrors:
         with raises(ValueError):
             self.nw.solve('ofdesign')
 
+    def test_bad_linear_solver_specification(self):
+        source = Source('source')
+        sink = Sink('sink')
+        a = Connection(source, 'out1', sink, 'in1')
+        self.nw.add_conns(a)
+        with raises(ValueError):
+            self.nw.solve('design', linear_solver='sparse')
+
     def test_underdetermination(self):
         source = Source('source')
         sink = Sink('sink')
@@ -85,6 +85,27 @@ class TestNetworks:
                'iter statement.')
         assert self.nw.max_iter == self.nw.iter + 1, msg
 
+    def test_Network_linear_solvers(self):
+        """Test the iterative linear solvers against the direct solver."""
+        self.setup_Network_tests()
+        pi = Pipe('pipe', pr=0.95, Q=-5e3)
+        a = Connection(self.source, 'out1', pi, 'in1', m=1, p=10, T=350,
+                       fluid={'water': 1})
+        b = Connection(pi, 'out1', self.sink, 'in1')
+        self.nw.add_conns(a, b)
+        self.nw.solve('design')
+        h_direct = b.h.val_SI
+        for solver in ['lsmr', 'gmres', 'mixed']:
+            self.nw.solve('design', linear_solver=solver)
+            msg = ('The linear solver ' + solver + ' must not detect a '
+                   'linear dependency in this well posed problem.')
+            assert self.nw.lin_dep is False, msg
+            msg = ('The result of the linear solver ' + solver + ' must '
+                   'match the direct solver, deviation at the outlet '
+                   'enthalpy is ' + str(round(b.h.val_SI - h_direct, 6)) +
+                   '.')
+            assert round(b.h.val_SI, 3) == round(h_direct, 3), msg
+
     def test_Network_delete_conns(self):
         """Test deleting a network's connection."""
         self.setup_Network_tests()
@@ -221,6 +221,29 @@ def test_TESPyFluid_mixture():
     shutil.rmtree('LUT', ignore_errors=True)
 
 
+def test_T_ph_batch():
+    """
+    Test the batch temperature lookup against the scalar lookup.
+
+    The batch evaluation bypasses the memorisation and runs through the
+    CoolProp high level interface, so it must reproduce the values of the
+    scalar AbstractState path.
+    """
+    fp.Memorise.add_fluids({'water': 'HEOS'})
+
+    p = np.linspace(1e5, 1e7, 20)
+    h = np.linspace(2e5, 3e6, 20)
+    T_batch = fp.T_ph_batch(p, h, 'HEOS::water')
+    for i in range(len(p)):
+        T_scalar = fp.T_ph(p[i], h[i], 'water')
+        d_rel = abs((T_batch[i] - T_scalar) / T_scalar)
+        msg = ('Relative deviation of the batch temperature lookup to the '
+               'scalar lookup is ' + str(round(d_rel, 12)) + ' at inputs p=' +
+               str(round(p[i], 0)) + ', h=' + str(round(h[i], 0)) +
+               ', should be < 1e-9.')
+        assert d_rel < 1e-9, msg
+
+
 class TestFluidPropertyBackEnds:
     """Testing full models with different fluid property back ends."""
 